@@ -1,6 +1,9 @@
 """Gmail OAuth2 authentication."""
 
 import json
+import os
+import threading
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
 
@@ -16,6 +19,10 @@ SCOPES = [
 
 DEFAULT_CONFIG_DIR = Path.home() / ".email-assistant"
 
+# Refresh in the background this long before the token actually expires,
+# so API calls never pay the ~300ms refresh round-trip.
+REFRESH_MARGIN = timedelta(minutes=5)
+
 
 class GmailAuth:
     """Handles Gmail OAuth2 authentication flow."""
@@ -25,12 +32,16 @@ class GmailAuth:
         self.config_dir.mkdir(parents=True, exist_ok=True)
         self.credentials_path = self.config_dir / "credentials.json"
         self.token_path = self.config_dir / "token.json"
+        self._refresh_thread: Optional[threading.Thread] = None
 
     def get_credentials(self) -> Optional[Credentials]:
         """Get valid credentials, refreshing or re-authenticating if needed."""
         creds = self._load_token()
 
         if creds and creds.valid:
+            if creds.refresh_token and creds.expiry:
+                if creds.expiry - datetime.utcnow() < REFRESH_MARGIN:
+                    self._refresh_in_background(creds)
             return creds
 
         if creds and creds.expired and creds.refresh_token:
@@ -56,6 +67,21 @@ class GmailAuth:
         self._save_token(creds)
         return creds
 
+    def _refresh_in_background(self, creds: Credentials) -> None:
+        """Refresh a soon-to-expire token off the request path."""
+        if self._refresh_thread is not None and self._refresh_thread.is_alive():
+            return
+
+        def _refresh():
+            try:
+                creds.refresh(Request())
+                self._save_token(creds)
+            except Exception:
+                pass  # Still valid; the sync path will retry at expiry
+
+        self._refresh_thread = threading.Thread(target=_refresh, daemon=True)
+        self._refresh_thread.start()
+
     def is_authenticated(self) -> bool:
         """Check if valid credentials exist."""
         creds = self.get_credentials()
@@ -72,7 +98,7 @@ class GmailAuth:
             return None
 
     def _save_token(self, creds: Credentials) -> None:
-        """Save token to disk."""
+        """Save token to disk atomically (safe against concurrent refreshers)."""
         token_data = {
             "token": creds.token,
             "refresh_token": creds.refresh_token,
@@ -81,7 +107,13 @@ class GmailAuth:
             "client_secret": creds.client_secret,
             "scopes": creds.scopes,
         }
-        self.token_path.write_text(json.dumps(token_data))
+        # Without expiry, from_authorized_user_file treats loaded tokens as
+        # already expired and every startup pays a synchronous refresh.
+        if creds.expiry:
+            token_data["expiry"] = creds.expiry.isoformat() + "Z"
+        tmp_path = self.token_path.with_suffix(".json.tmp")
+        tmp_path.write_text(json.dumps(token_data))
+        os.replace(tmp_path, self.token_path)
 
     def revoke(self) -> None:
         """Revoke and delete stored credentials."""
@@ -1,38 +1,83 @@
 """Gmail API client wrapper."""
 
 import base64
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from email.utils import parseaddr, parsedate_to_datetime
-from typing import Optional
+from email.utils import getaddresses, parseaddr, parsedate_to_datetime
+from itertools import islice
+from typing import Iterator, Optional
 
+import httplib2
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
 
 from .auth import GmailAuth
 from .models import Attachment, Email, EmailThread, Label
 
+# Gmail caps batch HTTP requests at 100 calls.
+BATCH_GET_SIZE = 100
+
+# Concurrent single-message fetches when the batch endpoint is unavailable.
+PARALLEL_GET_WORKERS = 20
+
+# Max parsed emails kept in the in-memory cache.
+EMAIL_CACHE_SIZE = 2048
+
+# Max parsed threads kept in the in-memory cache.
+THREAD_CACHE_SIZE = 256
+
+# Gmail caps batchModify at 1000 message IDs per request.
+BATCH_MODIFY_SIZE = 1000
+
+# Headers needed to render a list entry; metadata format skips body download.
+METADATA_HEADERS = ["From", "To", "Cc", "Subject", "Date"]
+
 
 class GmailClient:
     """High-level Gmail API client."""
 
     def __init__(self, auth: Optional[GmailAuth] = None):
         self.auth = auth or GmailAuth()
-        self._service = None
+        self._local = threading.local()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._email_cache: dict[str, Email] = {}
+        self._thread_cache: dict[str, EmailThread] = {}
 
     @property
     def service(self):
-        """Lazy-load Gmail API service."""
-        if self._service is None:
-            creds = self.auth.get_credentials()
-            if creds is None:
-                raise RuntimeError("Not authenticated. Call authenticate() first.")
-            self._service = build("gmail", "v1", credentials=creds)
-        return self._service
+        """Lazy-load the Gmail API service for the current thread.
+
+        One service (and keep-alive transport) per thread, because httplib2
+        objects are not thread-safe; this makes every client method safe to
+        call from worker threads.
+        """
+        if getattr(self._local, "service", None) is None:
+            self._local.service = self._build_service()
+        return self._local.service
+
+    def _build_service(self):
+        """Build a Gmail service on a keep-alive HTTP transport.
+
+        httplib2 reuses its TCP/TLS connection per host as long as the same
+        Http object is reused, so all calls through one service share a
+        session instead of re-handshaking.
+        """
+        creds = self.auth.get_credentials()
+        if creds is None:
+            raise RuntimeError("Not authenticated. Call authenticate() first.")
+        authed_http = AuthorizedHttp(creds, http=httplib2.Http())
+        return build("gmail", "v1", http=authed_http, cache_discovery=False)
 
     def authenticate(self) -> None:
         """Run OAuth flow if not authenticated."""
         if not self.auth.is_authenticated():
             self.auth.authenticate()
-            self._service = None  # Reset to pick up new credentials
+            self._local = threading.local()  # Reset to pick up new credentials
+            # Cached messages may belong to the previous account
+            self._email_cache.clear()
+            self._thread_cache.clear()
 
     def get_profile(self) -> dict:
         """Get user's Gmail profile."""
@@ -50,30 +95,106 @@ class GmailClient:
         max_results: int = 200,
         unread_only: bool = False,
         label_ids: Optional[list[str]] = None,
+        format: str = "metadata",
     ) -> list[Email]:
-        """Fetch emails matching query."""
+        """Fetch emails matching query.
+
+        Defaults to format="metadata" (headers + snippet, no body), which is
+        10-100x less data than "full" and enough for list views and triage.
+        Pass format="full" when bodies are needed.
+        """
+        return list(
+            islice(
+                self.iter_emails(
+                    query=query,
+                    unread_only=unread_only,
+                    label_ids=label_ids,
+                    page_size=min(100, max_results),
+                    format=format,
+                ),
+                max_results,
+            )
+        )
+
+    def iter_emails(
+        self,
+        query: str = "",
+        unread_only: bool = False,
+        label_ids: Optional[list[str]] = None,
+        page_size: int = 100,
+        format: str = "metadata",
+    ) -> "Iterator[Email]":
+        """Yield emails matching query, streaming one page at a time.
+
+        Pages through messages.list with list_next, so callers start
+        receiving parsed emails after the first page instead of waiting for
+        the whole result set, and memory stays bounded by page_size.
+        """
         if unread_only:
             query = f"is:unread {query}".strip()
 
-        params = {"userId": "me", "maxResults": max_results}
+        params = {"userId": "me", "maxResults": page_size}
         if query:
             params["q"] = query
         if label_ids:
             params["labelIds"] = label_ids
 
-        results = self.service.users().messages().list(**params).execute()
-        messages = results.get("messages", [])
-
-        emails = []
-        for msg in messages:
-            email = self.get_email(msg["id"])
+        messages_api = self.service.users().messages()
+        request = messages_api.list(**params)
+        while request is not None:
+            results = request.execute()
+            messages = results.get("messages", [])
+            request = messages_api.list_next(request, results)
+            yield from self._batch_get([msg["id"] for msg in messages], format=format)
+
+    def _batch_get(self, message_ids: list[str], format: str = "full") -> list[Email]:
+        """Fetch many emails in batched HTTP requests (100 per round-trip)."""
+        parsed: dict[str, Email] = {
+            mid: self._email_cache[mid] for mid in message_ids if mid in self._email_cache
+        }
+        missing = [mid for mid in message_ids if mid not in parsed]
+
+        get_params = {"userId": "me", "format": format}
+        if format == "metadata":
+            get_params["metadataHeaders"] = METADATA_HEADERS
+
+        def callback(request_id, response, exception):
+            if exception is not None:
+                return
+            email = self._parse_message(response)
             if email:
-                emails.append(email)
+                parsed[request_id] = email
+                if format == "full":
+                    self._cache_email(email)
 
-        return emails
+        try:
+            for start in range(0, len(missing), BATCH_GET_SIZE):
+                batch = self.service.new_batch_http_request(callback=callback)
+                for mid in missing[start : start + BATCH_GET_SIZE]:
+                    batch.add(
+                        self.service.users().messages().get(id=mid, **get_params),
+                        request_id=mid,
+                    )
+                batch.execute()
+        except HttpError:
+            # Google occasionally disables the batch endpoint; fall back to
+            # concurrent single gets so latency still overlaps.
+            return self._parallel_get(message_ids)
+
+        return [parsed[mid] for mid in message_ids if mid in parsed]
+
+    def _parallel_get(self, message_ids: list[str]) -> list[Email]:
+        """Fetch emails concurrently when the batch endpoint is unavailable."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=PARALLEL_GET_WORKERS)
+        emails = self._executor.map(self.get_email, message_ids)
+        return [email for email in emails if email]
 
     def get_email(self, message_id: str) -> Optional[Email]:
-        """Get full email by ID."""
+        """Get full email by ID (cached; repeat fetches skip the network)."""
+        cached = self._email_cache.get(message_id)
+        if cached is not None:
+            return cached
         try:
             msg = (
                 self.service.users()
@@ -81,16 +202,37 @@ class GmailClient:
                 .get(userId="me", id=message_id, format="full")
                 .execute()
             )
-            return self._parse_message(msg)
+            email = self._parse_message(msg)
+            if email:
+                self._cache_email(email)
+            return email
         except Exception:
             return None
 
+    def _cache_email(self, email: Email) -> None:
+        """Store a parsed email, evicting the oldest entry when full."""
+        if len(self._email_cache) >= EMAIL_CACHE_SIZE:
+            self._email_cache.pop(next(iter(self._email_cache)))
+        self._email_cache[email.id] = email
+
+    def invalidate(self, message_id: str) -> None:
+        """Drop cached state after a mutation so reads stay consistent.
+
+        Threads aren't keyed by message ID, so the whole thread cache goes;
+        mutations are rare relative to reads.
+        """
+        self._email_cache.pop(message_id, None)
+        self._thread_cache.clear()
+
     def search_emails(self, query: str, max_results: int = 200) -> list[Email]:
         """Search emails using Gmail query syntax."""
         return self.get_emails(query=query, max_results=max_results)
 
     def get_thread(self, thread_id: str) -> Optional[EmailThread]:
-        """Get full email thread."""
+        """Get full email thread (cached; repeat fetches skip the network)."""
+        cached = self._thread_cache.get(thread_id)
+        if cached is not None:
+            return cached
         try:
             thread = (
                 self.service.users()
@@ -101,12 +243,16 @@ class GmailClient:
             messages = [self._parse_message(m) for m in thread.get("messages", [])]
             messages = [m for m in messages if m is not None]
 
-            return EmailThread(
+            result = EmailThread.model_construct(
                 id=thread_id,
                 subject=messages[0].subject if messages else "",
                 messages=messages,
                 snippet=thread.get("snippet", ""),
             )
+            if len(self._thread_cache) >= THREAD_CACHE_SIZE:
+                self._thread_cache.pop(next(iter(self._thread_cache)))
+            self._thread_cache[thread_id] = result
+            return result
         except Exception:
             return None
 
@@ -127,6 +273,31 @@ class GmailClient:
             self.service.users().messages().modify(
                 userId="me", id=message_id, body=body
             ).execute()
+            self.invalidate(message_id)
+            return True
+        except Exception:
+            return False
+
+    def batch_modify_labels(
+        self,
+        message_ids: list[str],
+        add_labels: Optional[list[str]] = None,
+        remove_labels: Optional[list[str]] = None,
+    ) -> bool:
+        """Apply one label change to many emails via batchModify (1000 IDs/request)."""
+        try:
+            for start in range(0, len(message_ids), BATCH_MODIFY_SIZE):
+                chunk = message_ids[start : start + BATCH_MODIFY_SIZE]
+                self.service.users().messages().batchModify(
+                    userId="me",
+                    body={
+                        "ids": chunk,
+                        "addLabelIds": add_labels or [],
+                        "removeLabelIds": remove_labels or [],
+                    },
+                ).execute()
+                for mid in chunk:
+                    self.invalidate(mid)
             return True
         except Exception:
             return False
@@ -136,8 +307,13 @@ class GmailClient:
         return self.modify_labels(message_id, remove_labels=["INBOX"])
 
     def archive_emails(self, message_ids: list[str]) -> dict[str, bool]:
-        """Archive multiple emails."""
-        return {msg_id: self.archive_email(msg_id) for msg_id in message_ids}
+        """Archive multiple emails in one batchModify call."""
+        ok = self.batch_modify_labels(message_ids, remove_labels=["INBOX"])
+        return {msg_id: ok for msg_id in message_ids}
+
+    def mark_read_many(self, message_ids: list[str]) -> bool:
+        """Mark multiple emails as read in one batchModify call."""
+        return self.batch_modify_labels(message_ids, remove_labels=["UNREAD"])
 
     def mark_read(self, message_id: str) -> bool:
         """Mark email as read."""
@@ -159,14 +335,60 @@ class GmailClient:
         """Move email to trash."""
         try:
             self.service.users().messages().trash(userId="me", id=message_id).execute()
+            self.invalidate(message_id)
             return True
         except Exception:
             return False
 
+    def trash_emails(self, message_ids: list[str]) -> dict[str, bool]:
+        """Move many emails to trash via batched HTTP requests.
+
+        Trash has no batchModify-style endpoint, so group the per-message
+        trash calls into batch HTTP requests (100 per round-trip). Falls
+        back to concurrent single calls if the batch endpoint is rejected.
+        """
+        results: dict[str, bool] = {}
+
+        def callback(request_id, response, exception):
+            results[request_id] = exception is None
+            if exception is None:
+                self.invalidate(request_id)
+
+        try:
+            for start in range(0, len(message_ids), BATCH_GET_SIZE):
+                batch = self.service.new_batch_http_request(callback=callback)
+                for mid in message_ids[start : start + BATCH_GET_SIZE]:
+                    batch.add(
+                        self.service.users().messages().trash(userId="me", id=mid),
+                        request_id=mid,
+                    )
+                batch.execute()
+        except HttpError:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=PARALLEL_GET_WORKERS)
+            return dict(zip(message_ids, self._executor.map(self.trash_email, message_ids)))
+
+        return results
+
     def delete_email(self, message_id: str) -> bool:
         """Permanently delete email."""
         try:
             self.service.users().messages().delete(userId="me", id=message_id).execute()
+            self.invalidate(message_id)
+            return True
+        except Exception:
+            return False
+
+    def delete_emails(self, message_ids: list[str]) -> bool:
+        """Permanently delete many emails via batchDelete (1000 IDs/request)."""
+        try:
+            for start in range(0, len(message_ids), BATCH_MODIFY_SIZE):
+                chunk = message_ids[start : start + BATCH_MODIFY_SIZE]
+                self.service.users().messages().batchDelete(
+                    userId="me", body={"ids": chunk}
+                ).execute()
+                for mid in chunk:
+                    self.invalidate(mid)
             return True
         except Exception:
             return False
@@ -174,39 +396,45 @@ class GmailClient:
     def _parse_message(self, msg: dict) -> Optional[Email]:
         """Parse Gmail API message into Email model."""
         try:
-            headers = {h["name"].lower(): h["value"] for h in msg["payload"].get("headers", [])}
+            # Pluck just the headers we render instead of building a dict
+            # of all ~15 of them per message
+            subject = sender_raw = to_raw = cc_raw = date_str = ""
+            for h in msg["payload"].get("headers", ()):
+                name = h["name"].lower()
+                if name == "subject":
+                    subject = h["value"]
+                elif name == "from":
+                    sender_raw = h["value"]
+                elif name == "to":
+                    to_raw = h["value"]
+                elif name == "cc":
+                    cc_raw = h["value"]
+                elif name == "date":
+                    date_str = h["value"]
 
             # Parse sender
-            sender_raw = headers.get("from", "")
             sender_name, sender_email = parseaddr(sender_raw)
 
-            # Parse recipients
-            to_raw = headers.get("to", "")
-            recipients = [parseaddr(r)[1] for r in to_raw.split(",") if r.strip()]
-
-            cc_raw = headers.get("cc", "")
-            cc = [parseaddr(r)[1] for r in cc_raw.split(",") if r.strip()]
-
-            # Parse date
-            date_str = headers.get("date", "")
+            # Parse recipients; getaddresses handles quoted display names
+            # like '"Doe, John" <j@x>' that naive comma-splitting breaks on
+            recipients = [addr for _, addr in getaddresses([to_raw]) if addr]
+            cc = [addr for _, addr in getaddresses([cc_raw]) if addr]
             try:
                 date = parsedate_to_datetime(date_str)
             except Exception:
                 date = datetime.now()
 
-            # Extract body
-            body_text, body_html = self._extract_body(msg["payload"])
-
-            # Extract attachments
-            attachments = self._extract_attachments(msg["payload"])
+            # Extract body and attachments in one traversal
+            body_text, body_html, attachments = self._walk_payload(msg["payload"])
 
             # Check labels
             labels = msg.get("labelIds", [])
+            label_set = frozenset(labels)
 
-            return Email(
+            return Email.model_construct(
                 id=msg["id"],
                 thread_id=msg["threadId"],
-                subject=headers.get("subject", ""),
+                subject=subject,
                 sender=sender_name or sender_email,
                 sender_email=sender_email,
                 recipients=recipients,
@@ -217,52 +445,46 @@ class GmailClient:
                 body_html=body_html,
                 labels=labels,
                 attachments=attachments,
-                is_unread="UNREAD" in labels,
-                is_starred="STARRED" in labels,
+                is_unread="UNREAD" in label_set,
+                is_starred="STARRED" in label_set,
             )
         except Exception:
             return None
 
-    def _extract_body(self, payload: dict) -> tuple[str, str]:
-        """Extract text and HTML body from message payload."""
+    def _walk_payload(self, payload: dict) -> tuple[str, str, list[Attachment]]:
+        """Extract text body, HTML body, and attachments in one iterative pass.
+
+        Walks the MIME tree with an explicit stack (pre-order, no recursion)
+        so deep multipart messages don't pay a frame per part or get scanned
+        twice.
+        """
         body_text = ""
         body_html = ""
-
-        if "body" in payload and payload["body"].get("data"):
-            data = payload["body"]["data"]
-            decoded = base64.urlsafe_b64decode(data).decode("utf-8", errors="ignore")
-            mime_type = payload.get("mimeType", "")
-            if "html" in mime_type:
-                body_html = decoded
-            else:
-                body_text = decoded
-
-        if "parts" in payload:
-            for part in payload["parts"]:
-                part_text, part_html = self._extract_body(part)
-                if part_text:
-                    body_text = part_text
-                if part_html:
-                    body_html = part_html
-
-        return body_text, body_html
-
-    def _extract_attachments(self, payload: dict) -> list[Attachment]:
-        """Extract attachment metadata from message payload."""
         attachments = []
 
-        if "parts" in payload:
-            for part in payload["parts"]:
-                if part.get("filename"):
-                    attachments.append(
-                        Attachment(
-                            id=part["body"].get("attachmentId", ""),
-                            filename=part["filename"],
-                            mime_type=part.get("mimeType", "application/octet-stream"),
-                            size=part["body"].get("size", 0),
-                        )
+        stack = [payload]
+        while stack:
+            part = stack.pop()
+
+            body = part.get("body", {})
+            if body.get("data"):
+                decoded = base64.urlsafe_b64decode(body["data"]).decode("utf-8", errors="ignore")
+                if "html" in part.get("mimeType", ""):
+                    body_html = decoded
+                else:
+                    body_text = decoded
+
+            if part is not payload and part.get("filename"):
+                attachments.append(
+                    Attachment.model_construct(
+                        id=body.get("attachmentId", ""),
+                        filename=part["filename"],
+                        mime_type=part.get("mimeType", "application/octet-stream"),
+                        size=body.get("size", 0),
                     )
-                # Recurse for nested parts
-                attachments.extend(self._extract_attachments(part))
+                )
+
+            # Reversed so parts are visited in document order
+            stack.extend(reversed(part.get("parts", ())))
 
-        return attachments
+        return body_text, body_html, attachments
@@ -2,6 +2,7 @@
 
 from datetime import datetime
 from enum import Enum
+from functools import cached_property
 from typing import Optional
 
 from pydantic import BaseModel, Field
@@ -49,6 +50,16 @@ class Email(BaseModel):
     summary: Optional[str] = None
     needs_reply: Optional[bool] = None
 
+    @cached_property
+    def labels_set(self) -> frozenset[str]:
+        """Labels as a frozenset for O(1) membership tests."""
+        return frozenset(self.labels)
+
+    @cached_property
+    def search_text(self) -> str:
+        """Subject + snippet, casefolded once for repeated keyword matching."""
+        return f"{self.subject} {self.snippet}".casefold()
+
 
 class EmailThread(BaseModel):
     """Represents a Gmail thread with multiple messages."""
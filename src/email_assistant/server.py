@@ -6,7 +6,10 @@ by the Claude Code skill at ~/.claude/skills/gmail/.
 """
 
 import asyncio
-from typing import Any
+import json
+import time
+from functools import lru_cache, partial
+from typing import Any, Callable
 
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
@@ -17,6 +20,21 @@ from .gmail import GmailClient
 server = Server("email-assistant")
 gmail_client: GmailClient | None = None
 
+# Concurrent Gmail calls per bulk tool call, kept under Gmail's per-user QPS.
+BULK_CONCURRENCY = 10
+
+
+async def _gather_bulk(op: Callable[[str], bool], email_ids: list[str]) -> int:
+    """Run a per-email operation concurrently; return the success count."""
+    sem = asyncio.Semaphore(BULK_CONCURRENCY)
+
+    async def one(eid: str) -> bool:
+        async with sem:
+            return await asyncio.to_thread(op, eid)
+
+    results = await asyncio.gather(*(one(eid) for eid in email_ids), return_exceptions=True)
+    return sum(1 for r in results if r is True)
+
 
 def get_gmail() -> GmailClient:
     global gmail_client
@@ -25,183 +43,209 @@ def get_gmail() -> GmailClient:
     return gmail_client
 
 
-@server.list_tools()
-async def list_tools() -> list[Tool]:
-    """List available MCP tools."""
-    return [
-        # Auth
-        Tool(
-            name="authenticate",
-            description="Authenticate with Gmail. Run this first if not authenticated.",
-            inputSchema={"type": "object", "properties": {}},
-        ),
-        Tool(
-            name="check_auth",
-            description="Check if authenticated with Gmail.",
-            inputSchema={"type": "object", "properties": {}},
-        ),
-        # Core email tools
-        Tool(
-            name="get_emails",
-            description="Fetch emails from inbox with optional filters.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "Gmail search query (e.g., 'from:boss@company.com')",
-                    },
-                    "max_results": {
-                        "type": "integer",
-                        "description": "Maximum number of emails to return",
-                        "default": 200,
-                    },
-                    "unread_only": {
-                        "type": "boolean",
-                        "description": "Only return unread emails",
-                        "default": False,
-                    },
+# The Gmail profile never changes within an authenticated session; cache it
+# so check_auth is a pure in-memory check instead of an API round trip.
+PROFILE_TTL = 86400
+_profile_cache: tuple[float, dict] | None = None
+
+
+def _cached_profile(gmail: GmailClient) -> dict:
+    global _profile_cache
+    if _profile_cache and time.monotonic() - _profile_cache[0] < PROFILE_TTL:
+        return _profile_cache[1]
+    profile = gmail.get_profile()
+    _profile_cache = (time.monotonic(), profile)
+    return profile
+
+
+# Labels change rarely but the skill layer lists them often; cache the
+# formatted listing briefly and drop it whenever labels are modified.
+LABELS_TTL = 300
+_labels_cache: tuple[float, str] | None = None
+
+
+# Built once at import; the tool list is static and list_tools is polled
+# frequently by MCP clients.
+_TOOLS: list[Tool] = [
+    # Auth
+    Tool(
+        name="authenticate",
+        description="Authenticate with Gmail. Run this first if not authenticated.",
+        inputSchema={"type": "object", "properties": {}},
+    ),
+    Tool(
+        name="check_auth",
+        description="Check if authenticated with Gmail.",
+        inputSchema={"type": "object", "properties": {}},
+    ),
+    # Core email tools
+    Tool(
+        name="get_emails",
+        description="Fetch emails from inbox with optional filters.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Gmail search query (e.g., 'from:boss@company.com')",
                 },
-            },
-        ),
-        Tool(
-            name="search_emails",
-            description="Search emails using Gmail query syntax.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "Gmail search query",
-                    },
-                    "max_results": {
-                        "type": "integer",
-                        "description": "Maximum results",
-                        "default": 200,
-                    },
+                "max_results": {
+                    "type": "integer",
+                    "description": "Maximum number of emails to return",
+                    "default": 200,
                 },
-                "required": ["query"],
-            },
-        ),
-        Tool(
-            name="get_email",
-            description="Get a single email by ID with full content.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "email_id": {"type": "string", "description": "Email message ID"},
+                "unread_only": {
+                    "type": "boolean",
+                    "description": "Only return unread emails",
+                    "default": False,
                 },
-                "required": ["email_id"],
             },
-        ),
-        Tool(
-            name="get_thread",
-            description="Get an email thread with all messages.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "thread_id": {"type": "string", "description": "Thread ID"},
+        },
+    ),
+    Tool(
+        name="search_emails",
+        description="Search emails using Gmail query syntax.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Gmail search query",
                 },
-                "required": ["thread_id"],
-            },
-        ),
-        Tool(
-            name="modify_labels",
-            description="Add or remove labels from an email.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "email_id": {"type": "string", "description": "Email message ID"},
-                    "add_labels": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Labels to add",
-                    },
-                    "remove_labels": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Labels to remove",
-                    },
+                "max_results": {
+                    "type": "integer",
+                    "description": "Maximum results",
+                    "default": 200,
                 },
-                "required": ["email_id"],
             },
-        ),
-        Tool(
-            name="archive_email",
-            description="Archive one or more emails (remove from inbox).",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "email_ids": {
-                        "oneOf": [
-                            {"type": "string"},
-                            {"type": "array", "items": {"type": "string"}},
-                        ],
-                        "description": "Email ID(s) to archive",
-                    },
+            "required": ["query"],
+        },
+    ),
+    Tool(
+        name="get_email",
+        description="Get a single email by ID with full content.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "email_id": {"type": "string", "description": "Email message ID"},
+            },
+            "required": ["email_id"],
+        },
+    ),
+    Tool(
+        name="get_thread",
+        description="Get an email thread with all messages.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "thread_id": {"type": "string", "description": "Thread ID"},
+            },
+            "required": ["thread_id"],
+        },
+    ),
+    Tool(
+        name="modify_labels",
+        description="Add or remove labels from an email.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "email_id": {"type": "string", "description": "Email message ID"},
+                "add_labels": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Labels to add",
+                },
+                "remove_labels": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Labels to remove",
                 },
-                "required": ["email_ids"],
             },
-        ),
-        Tool(
-            name="trash_email",
-            description="Move one or more emails to trash.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "email_ids": {
-                        "oneOf": [
-                            {"type": "string"},
-                            {"type": "array", "items": {"type": "string"}},
-                        ],
-                        "description": "Email ID(s) to trash",
-                    },
+            "required": ["email_id"],
+        },
+    ),
+    Tool(
+        name="archive_email",
+        description="Archive one or more emails (remove from inbox).",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "email_ids": {
+                    "oneOf": [
+                        {"type": "string"},
+                        {"type": "array", "items": {"type": "string"}},
+                    ],
+                    "description": "Email ID(s) to archive",
                 },
-                "required": ["email_ids"],
             },
-        ),
-        Tool(
-            name="batch_label",
-            description="Add or remove labels from multiple emails at once.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "email_ids": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Email IDs to modify",
-                    },
-                    "add_labels": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Labels to add",
-                    },
-                    "remove_labels": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Labels to remove",
-                    },
+            "required": ["email_ids"],
+        },
+    ),
+    Tool(
+        name="trash_email",
+        description="Move one or more emails to trash.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "email_ids": {
+                    "oneOf": [
+                        {"type": "string"},
+                        {"type": "array", "items": {"type": "string"}},
+                    ],
+                    "description": "Email ID(s) to trash",
                 },
-                "required": ["email_ids"],
             },
-        ),
-        Tool(
-            name="mark_read",
-            description="Mark email as read.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "email_id": {"type": "string", "description": "Email message ID"},
+            "required": ["email_ids"],
+        },
+    ),
+    Tool(
+        name="batch_label",
+        description="Add or remove labels from multiple emails at once.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "email_ids": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Email IDs to modify",
+                },
+                "add_labels": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Labels to add",
+                },
+                "remove_labels": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Labels to remove",
                 },
-                "required": ["email_id"],
             },
-        ),
-        Tool(
-            name="list_labels",
-            description="List all Gmail labels.",
-            inputSchema={"type": "object", "properties": {}},
-        ),
-    ]
+            "required": ["email_ids"],
+        },
+    ),
+    Tool(
+        name="mark_read",
+        description="Mark email as read.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "email_id": {"type": "string", "description": "Email message ID"},
+            },
+            "required": ["email_id"],
+        },
+    ),
+    Tool(
+        name="list_labels",
+        description="List all Gmail labels.",
+        inputSchema={"type": "object", "properties": {}},
+    ),
+]
+
+
+@server.list_tools()
+async def list_tools() -> list[Tool]:
+    """List available MCP tools."""
+    return _TOOLS
 
 
 @server.call_tool()
@@ -209,156 +253,291 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
     """Handle tool calls."""
     try:
         result = await _handle_tool(name, arguments)
-        return [TextContent(type="text", text=str(result))]
+        if isinstance(result, list):
+            # Pre-chunked output: emit one TextContent per chunk so large
+            # results stream to the client instead of building one giant string
+            return [TextContent(type="text", text=chunk) for chunk in result]
+        # Non-string results serialize to JSON so clients get parseable
+        # output instead of Python repr
+        text = result if isinstance(result, str) else json.dumps(result, default=str)
+        return [TextContent(type="text", text=text)]
     except Exception as e:
         return [TextContent(type="text", text=f"Error: {e}")]
 
 
 async def _handle_tool(name: str, args: dict[str, Any]) -> Any:
-    """Route tool calls to implementations."""
-    gmail = get_gmail()
+    """Route tool calls to implementations via the handler table."""
+    handler = _HANDLERS.get(name)
+    if handler is None:
+        return f"Unknown tool: {name}"
+    return await handler(get_gmail(), args)
 
-    # Auth tools
-    if name == "authenticate":
-        gmail.authenticate()
-        profile = gmail.get_profile()
-        return f"Authenticated as {profile.get('emailAddress')}"
 
-    if name == "check_auth":
-        if gmail.auth.is_authenticated():
-            profile = gmail.get_profile()
-            return f"Authenticated as {profile.get('emailAddress')}"
-        return "Not authenticated. Call 'authenticate' tool first."
+# Tool implementations (one async function per tool, registered in _HANDLERS)
 
-    # Core email tools
-    if name == "get_emails":
-        emails = gmail.get_emails(
-            query=args.get("query", ""),
-            max_results=args.get("max_results", 200),
-            unread_only=args.get("unread_only", False),
-        )
-        return _format_email_list(emails)
 
-    if name == "search_emails":
-        emails = gmail.search_emails(
-            query=args["query"],
-            max_results=args.get("max_results", 200),
-        )
-        return _format_email_list(emails)
-
-    if name == "get_email":
-        email = gmail.get_email(args["email_id"])
-        if email:
-            return _format_email_detail(email)
-        return "Email not found"
-
-    if name == "get_thread":
-        thread = gmail.get_thread(args["thread_id"])
-        if thread:
-            return _format_thread(thread)
-        return "Thread not found"
-
-    if name == "modify_labels":
-        success = gmail.modify_labels(
-            args["email_id"],
-            add_labels=args.get("add_labels"),
-            remove_labels=args.get("remove_labels"),
-        )
-        return "Labels modified" if success else "Failed to modify labels"
-
-    if name == "archive_email":
-        email_ids = args["email_ids"]
-        if isinstance(email_ids, str):
-            email_ids = [email_ids]
-        results = gmail.archive_emails(email_ids)
-        success_count = sum(1 for v in results.values() if v)
-        return f"Archived {success_count}/{len(email_ids)} emails"
-
-    if name == "trash_email":
-        email_ids = args["email_ids"]
-        if isinstance(email_ids, str):
-            email_ids = [email_ids]
-        success_count = 0
-        for eid in email_ids:
-            if gmail.trash_email(eid):
-                success_count += 1
-        return f"Trashed {success_count}/{len(email_ids)} emails"
-
-    if name == "batch_label":
-        email_ids = args["email_ids"]
-        add_labels = args.get("add_labels")
-        remove_labels = args.get("remove_labels")
-        success_count = 0
-        for eid in email_ids:
-            if gmail.modify_labels(eid, add_labels=add_labels, remove_labels=remove_labels):
-                success_count += 1
-        return f"Modified labels on {success_count}/{len(email_ids)} emails"
-
-    if name == "mark_read":
-        success = gmail.mark_read(args["email_id"])
-        return "Marked as read" if success else "Failed to mark as read"
-
-    if name == "list_labels":
-        labels = gmail.list_labels()
-        return "\n".join(f"- {l.name} ({l.id})" for l in labels)
-
-    return f"Unknown tool: {name}"
-
-
-def _format_email_list(emails: list) -> str:
-    """Format list of emails for display."""
+async def _tool_authenticate(gmail: GmailClient, args: dict[str, Any]) -> str:
+    await asyncio.to_thread(gmail.authenticate)
+    global _profile_cache, _labels_cache
+    _profile_cache = None  # Re-fetch in case of account switch
+    _labels_cache = None
+    profile = await asyncio.to_thread(_cached_profile, gmail)
+    return f"Authenticated as {profile.get('emailAddress')}"
+
+
+async def _tool_check_auth(gmail: GmailClient, args: dict[str, Any]) -> str:
+    if await asyncio.to_thread(gmail.auth.is_authenticated):
+        profile = await asyncio.to_thread(_cached_profile, gmail)
+        return f"Authenticated as {profile.get('emailAddress')}"
+    return "Not authenticated. Call 'authenticate' tool first."
+
+
+async def _tool_get_emails(gmail: GmailClient, args: dict[str, Any]) -> str | list[str]:
+    emails = await asyncio.to_thread(
+        gmail.get_emails,
+        query=args.get("query", ""),
+        max_results=args.get("max_results", 200),
+        unread_only=args.get("unread_only", False),
+    )
+    return _format_email_list(emails)
+
+
+async def _tool_search_emails(gmail: GmailClient, args: dict[str, Any]) -> str | list[str]:
+    emails = await asyncio.to_thread(
+        gmail.search_emails,
+        query=args["query"],
+        max_results=args.get("max_results", 200),
+    )
+    return _format_email_list(emails)
+
+
+async def _tool_get_email(gmail: GmailClient, args: dict[str, Any]) -> str:
+    email = await asyncio.to_thread(gmail.get_email, args["email_id"])
+    if email:
+        return _format_email_detail(email)
+    return "Email not found"
+
+
+async def _tool_get_thread(gmail: GmailClient, args: dict[str, Any]) -> str:
+    thread = await asyncio.to_thread(gmail.get_thread, args["thread_id"])
+    if thread:
+        return _format_thread(thread)
+    return "Thread not found"
+
+
+async def _tool_modify_labels(gmail: GmailClient, args: dict[str, Any]) -> str:
+    success = await asyncio.to_thread(
+        gmail.modify_labels,
+        args["email_id"],
+        add_labels=args.get("add_labels"),
+        remove_labels=args.get("remove_labels"),
+    )
+    if success:
+        global _labels_cache
+        _labels_cache = None
+    return "Labels modified" if success else "Failed to modify labels"
+
+
+async def _bulk_op(
+    op: Callable[[list[str]], dict[str, bool]], email_ids: str | list[str], verb: str
+) -> str:
+    """Run a batched per-ID operation and report the success count."""
+    if isinstance(email_ids, str):
+        email_ids = [email_ids]
+    results = await asyncio.to_thread(op, email_ids)
+    success_count = sum(results.values())
+    return f"{verb} {success_count}/{len(email_ids)} emails"
+
+
+async def _tool_archive_email(gmail: GmailClient, args: dict[str, Any]) -> str:
+    return await _bulk_op(gmail.archive_emails, args["email_ids"], "Archived")
+
+
+async def _tool_trash_email(gmail: GmailClient, args: dict[str, Any]) -> str:
+    return await _bulk_op(gmail.trash_emails, args["email_ids"], "Trashed")
+
+
+async def _tool_batch_label(gmail: GmailClient, args: dict[str, Any]) -> str:
+    email_ids = args["email_ids"]
+    add_labels = args.get("add_labels")
+    remove_labels = args.get("remove_labels")
+    ok = await asyncio.to_thread(gmail.batch_modify_labels, email_ids, add_labels, remove_labels)
+    if ok:
+        success_count = len(email_ids)
+    else:
+        # batchModify is all-or-nothing; retry per-email so one bad ID
+        # doesn't fail the whole batch
+        op = partial(gmail.modify_labels, add_labels=add_labels, remove_labels=remove_labels)
+        success_count = await _gather_bulk(op, email_ids)
+    if success_count:
+        global _labels_cache
+        _labels_cache = None
+    return f"Modified labels on {success_count}/{len(email_ids)} emails"
+
+
+async def _tool_mark_read(gmail: GmailClient, args: dict[str, Any]) -> str:
+    success = await asyncio.to_thread(gmail.mark_read, args["email_id"])
+    return "Marked as read" if success else "Failed to mark as read"
+
+
+async def _tool_list_labels(gmail: GmailClient, args: dict[str, Any]) -> str:
+    global _labels_cache
+    if _labels_cache and time.monotonic() - _labels_cache[0] < LABELS_TTL:
+        return _labels_cache[1]
+    labels = await asyncio.to_thread(gmail.list_labels)
+    formatted = "\n".join(f"- {l.name} ({l.id})" for l in labels)
+    _labels_cache = (time.monotonic(), formatted)
+    return formatted
+
+
+_HANDLERS: dict[str, Callable] = {
+    "authenticate": _tool_authenticate,
+    "check_auth": _tool_check_auth,
+    "get_emails": _tool_get_emails,
+    "search_emails": _tool_search_emails,
+    "get_email": _tool_get_email,
+    "get_thread": _tool_get_thread,
+    "modify_labels": _tool_modify_labels,
+    "archive_email": _tool_archive_email,
+    "trash_email": _tool_trash_email,
+    "batch_label": _tool_batch_label,
+    "mark_read": _tool_mark_read,
+    "list_labels": _tool_list_labels,
+}
+
+
+_DATE_FMT = "%Y-%m-%d %H:%M"
+
+# Split list output into TextContent chunks of roughly this many chars.
+LIST_CHUNK_CHARS = 64_000
+
+
+@lru_cache(maxsize=4096)
+def _format_list_entry(
+    eid: str,
+    sender: str,
+    subject: str,
+    date_str: str,
+    snippet: str,
+    is_unread: bool,
+    is_starred: bool,
+) -> str:
+    """One display block per email, cached by content.
+
+    The skill layer re-lists the same inbox pages back-to-back while
+    triaging; content-derived keys mean repeat renders are dict hits and
+    staleness is impossible (changed content is a new key).
+    """
+    return (
+        f"{'[UNREAD] ' if is_unread else ''}{'[*] ' if is_starred else ''}"
+        f"{sender}: {subject}\n"
+        f"  ID: {eid} | Date: {date_str}\n"
+        f"  {snippet}\n"
+    )
+
+
+def _format_email_list(emails: list) -> str | list[str]:
+    """Format list of emails for display; chunked when the output is large."""
     if not emails:
         return "No emails found."
 
-    lines = []
-    for e in emails:
-        status = "[UNREAD] " if e.is_unread else ""
-        star = "[*] " if e.is_starred else ""
-        lines.append(f"{status}{star}{e.sender}: {e.subject}")
-        lines.append(f"  ID: {e.id} | Date: {e.date.strftime('%Y-%m-%d %H:%M')}")
-        lines.append(f"  {e.snippet[:100]}...")
-        lines.append("")
+    blocks = [
+        _format_list_entry(
+            e.id,
+            e.sender,
+            e.subject,
+            e.date.strftime(_DATE_FMT),
+            _truncate(e.snippet, 100),
+            e.is_unread,
+            e.is_starred,
+        )
+        for e in emails
+    ]
+    if sum(map(len, blocks)) <= LIST_CHUNK_CHARS:
+        return "\n".join(blocks)
+
+    chunks = []
+    buf: list[str] = []
+    size = 0
+    for block in blocks:
+        buf.append(block)
+        size += len(block) + 1
+        if size >= LIST_CHUNK_CHARS:
+            chunks.append("\n".join(buf))
+            buf, size = [], 0
+    if buf:
+        chunks.append("\n".join(buf))
+    return chunks
+
+
+def _truncate(s: str, limit: int) -> str:
+    """Cap a string at limit chars; only allocates a copy when over."""
+    return s if len(s) <= limit else s[:limit] + "..."
+
+
+_DETAIL_TMPL = """From: {sender} <{sender_email}>
+To: {recipients}
+Subject: {subject}
+Date: {date}
+Labels: {labels}
+Attachments: {attachments}
 
-    return "\n".join(lines)
+{body}"""
 
 
 def _format_email_detail(email) -> str:
     """Format single email for detailed view."""
-    body = email.body_text or email.body_html or email.snippet
-    if len(body) > 2000:
-        body = body[:2000] + "..."
-
-    return f"""From: {email.sender} <{email.sender_email}>
-To: {', '.join(email.recipients)}
-Subject: {email.subject}
-Date: {email.date.strftime('%Y-%m-%d %H:%M')}
-Labels: {', '.join(email.labels)}
-Attachments: {len(email.attachments)}
-
-{body}"""
+    return _DETAIL_TMPL.format_map(
+        {
+            "sender": email.sender,
+            "sender_email": email.sender_email,
+            "recipients": ", ".join(email.recipients),
+            "subject": email.subject,
+            "date": email.date.strftime(_DATE_FMT),
+            "labels": ", ".join(email.labels),
+            "attachments": len(email.attachments),
+            "body": _truncate(email.body_text or email.body_html or email.snippet, 2000),
+        }
+    )
 
 
 def _format_thread(thread) -> str:
     """Format email thread."""
-    lines = [f"Thread: {thread.subject}", f"Messages: {thread.message_count}", ""]
-    for msg in thread.messages:
-        lines.append(f"--- {msg.sender} ({msg.date.strftime('%Y-%m-%d %H:%M')}) ---")
-        body = msg.body_text or msg.snippet
-        if len(body) > 500:
-            body = body[:500] + "..."
-        lines.append(body)
-        lines.append("")
-    return "\n".join(lines)
+    return f"Thread: {thread.subject}\nMessages: {thread.message_count}\n\n" + "\n".join(
+        f"--- {msg.sender} ({msg.date.strftime(_DATE_FMT)}) ---\n"
+        f"{_truncate(msg.body_text or msg.snippet, 500)}\n"
+        for msg in thread.messages
+    )
+
+
+def _warm_client() -> GmailClient:
+    """Build the Gmail client and prime the profile cache if already authed."""
+    client = GmailClient()
+    if client.auth.is_authenticated():
+        try:
+            _cached_profile(client)
+        except Exception:
+            pass  # Priming is best-effort; the first tool call fetches it
+    return client
 
 
 async def run_server():
     """Run the MCP server."""
+    # Pay the OAuth/service init cost at boot, off the first tool call
+    global gmail_client
+    gmail_client = await asyncio.to_thread(_warm_client)
     async with stdio_server() as (read_stream, write_stream):
         await server.run(read_stream, write_stream, server.create_initialization_options())
 
 
 def main():
     """Entry point."""
+    try:
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass  # Default event loop works fine; uvloop is just faster
     asyncio.run(run_server())
 
 